@@ -8,6 +8,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import mysql.connector
 from sentence_transformers import SentenceTransformer
 
+from database.db import (
+    encode_embedding, export_embeddings, EMBEDDINGS_PARQUET, PYARROW_AVAILABLE,
+)
+
 embed_model = SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
 
 # Railway MySQL connection
@@ -18,7 +22,7 @@ conn = mysql.connector.connect(
     database="railway",
     port=29730
 )
-cur = conn.cursor()
+cur = conn.cursor(buffered=True)  # fetchone() leaves no unread rows behind
 
 QA_PAIRS = [
     {
@@ -71,29 +75,44 @@ QA_PAIRS = [
 added = 0
 skipped = 0
 
+new_pairs = []
 for qa in QA_PAIRS:
-    cur.execute("SELECT id FROM dr_young_all_articles WHERE title = %s", (qa["title"],))
+    cur.execute("SELECT id FROM dr_young_all_articles WHERE title = %s LIMIT 1", (qa["title"],))
     if cur.fetchone():
         print(f"  [SKIP] {qa['title'][:60]}...")
         skipped += 1
         continue
+    new_pairs.append(qa)
 
-    print(f"  [EMBED] {qa['title'][:60]}...")
-    embedding = embed_model.encode(qa["content"], convert_to_numpy=True)
-    embedding_str = str(embedding.tolist())
+# Embed all new pairs in one batched call, then insert them together
+if new_pairs:
+    print(f"  [EMBED] {len(new_pairs)} Q&A pairs...")
+    embeddings = embed_model.encode([qa["content"] for qa in new_pairs],
+                                    batch_size=64, convert_to_numpy=True)
 
-    cur.execute(
+    cur.executemany(
         "INSERT INTO dr_young_all_articles (title, url, content, embedding) VALUES (%s, %s, %s, %s)",
-        (qa["title"], qa["url"], qa["content"], embedding_str)
+        [(qa["title"], qa["url"], qa["content"], encode_embedding(embedding))
+         for qa, embedding in zip(new_pairs, embeddings)]
     )
-    added += 1
-    print(f"  [ADDED] {qa['title'][:60]}...")
+    for qa in new_pairs:
+        added += 1
+        print(f"  [ADDED] {qa['title'][:60]}...")
 
 conn.commit()
 
 cur.execute("SELECT COUNT(*) FROM dr_young_all_articles")
 total = cur.fetchone()[0]
 
+# Refresh the Parquet snapshot the API searches, so the new pairs are
+# searchable without waiting for the next scrape
+if added and EMBEDDINGS_PARQUET:
+    if PYARROW_AVAILABLE:
+        exported = export_embeddings(EMBEDDINGS_PARQUET, conn)
+        print(f"  [EXPORT] {exported} embeddings to {EMBEDDINGS_PARQUET}")
+    else:
+        print("  [WARNING] EMBEDDINGS_PARQUET is set but pyarrow is not installed; snapshot not refreshed")
+
 cur.close()
 conn.close()
 
@@ -13,12 +13,13 @@ import sys
 import os
 import time
 import re
-import ast
 import json
 import subprocess
 import numpy as np
 from collections import deque
+from contextlib import asynccontextmanager
 import asyncio
+import threading
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -44,13 +45,29 @@ except ImportError:
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.insert(0, project_root)
-from database.db import get_connection
+from database.db import (
+    get_pooled_connection, decode_embedding, load_embeddings,
+    EMBEDDINGS_PARQUET, PYARROW_AVAILABLE,
+)
+
+@asynccontextmanager
+async def lifespan(app):
+    """
+    Per-process startup: warm up the Ollama model in the background
+    
+    Runs in each server process rather than at import, so a gunicorn
+    --preload master neither starts a thread that fork() would not carry
+    over nor opens Ollama connections its workers would inherit.
+    """
+    threading.Thread(target=warm_up_ollama_model, daemon=True).start()
+    yield
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Dr. Robert Young Semantic Search API",
     description="Semantic search and Q&A system for Dr. Robert Young's blog content",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan             # Ollama warm-up per server process
 )
 
 # Initialize embedding model for vector search
@@ -64,6 +81,19 @@ embed_model = SentenceTransformer(
     device=device
 )
 
+# Load the Parquet embedding snapshot (if configured) so searches scan one
+# in-memory matrix instead of fetching every article from MySQL
+embedding_index = None
+if EMBEDDINGS_PARQUET and PYARROW_AVAILABLE and os.path.exists(EMBEDDINGS_PARQUET):
+    try:
+        index_ids, index_titles, index_matrix = load_embeddings(EMBEDDINGS_PARQUET)
+        # Pre-normalize rows so cosine similarity is a single matrix-vector product
+        index_matrix /= np.maximum(np.linalg.norm(index_matrix, axis=1, keepdims=True), 1e-12)
+        embedding_index = (index_ids, [t.lower() for t in index_titles], index_matrix)
+        print(f"[SEARCH] Loaded {len(index_ids)} embeddings from {EMBEDDINGS_PARQUET}")
+    except Exception as e:
+        print(f"[SEARCH] Could not load {EMBEDDINGS_PARQUET}: {e}")
+
 # Initialize Groq client for cloud LLM (if API key available)
 groq_client = None
 if GROQ_AVAILABLE:
@@ -80,6 +110,12 @@ if GROQ_AVAILABLE:
 else:
     print("[LLM] Using Ollama (Local mode - groq library not installed)")
 
+# Shared HTTP session for the local Ollama API: keeps the connection alive
+# between requests instead of opening a new socket for every call. It holds
+# no sockets until its first request, which happens in the serving process
+# (after any pre-fork; see lifespan below), so workers never share one.
+ollama_session = requests.Session()
+
 # Session-based conversation memory (stores last 5 interactions per conversation)
 conversation_memory = {}
 
@@ -90,7 +126,7 @@ def warm_up_ollama_model():
     """
     try:
         print("\n[OLLAMA] Warming up model...")
-        response = requests.post(
+        response = ollama_session.post(
             "http://localhost:11434/api/generate",
             json={
                 "model": "llama2:latest",
@@ -107,9 +143,6 @@ def warm_up_ollama_model():
         print(f"[OLLAMA] Warm-up failed: {e}")
         print("[OLLAMA] Model will load on first request (may take 10-15 seconds)")
 
-# Warm up model on startup (run in background to not block server start)
-import threading
-threading.Thread(target=warm_up_ollama_model, daemon=True).start()
 
 def get_conversation_history(conversation_id: str):
     """Get conversation history for given ID"""
@@ -249,13 +282,13 @@ def call_llama2_stream(prompt: str):
     """
     try:
         # Test Ollama connection first
-        test_response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        test_response = ollama_session.get("http://localhost:11434/api/tags", timeout=5)
         if test_response.status_code != 200:
             yield "[LLM ERROR]: Ollama service not responding"
             return
 
         # Establish streaming POST request to Ollama API
-        with requests.post(
+        with ollama_session.post(
             "http://localhost:11434/api/generate",
             json={
                 "model": "llama2:latest",           # Specify LLaMA2 model
@@ -339,7 +372,7 @@ def call_llama2_stream_direct(prompt: str):
     """
     try:
         # Establish streaming POST request to Ollama API
-        with requests.post(
+        with ollama_session.post(
             "http://localhost:11434/api/generate",
             json={
                 "model": "llama2:latest",           # Specify LLaMA2 model
@@ -546,36 +579,75 @@ async def chat(q: ChatRequest):
     )
     embed_time = time.time() - embed_start
 
-    # 2️⃣ Fetch articles from database
-    db_start = time.time()
-    conn = get_connection()
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT title, content, embedding, url FROM dr_young_all_articles")
-    rows = cur.fetchall()
-    db_time = time.time() - db_start
-
-    # Prepare list to store similarity scores
-    scored = []
-
-    # 3️⃣ Perform vector similarity search
-    search_start = time.time()
-    for r in rows:
-        # Convert stored embedding string back to numpy array
-        emb = np.array(ast.literal_eval(r["embedding"]))
-        # Calculate cosine similarity with query
-        score = cosine(query_emb, emb)
+    # Query terms for the title boost, lowercased once per request
+    words = q.question.lower().split()
+
+    if embedding_index is not None:
+        # 2️⃣ + 3️⃣ Search the in-memory snapshot, then fetch only the best article
+        search_start = time.time()
+        index_ids, index_titles, index_matrix = embedding_index
+        scores = index_matrix @ (query_emb / np.linalg.norm(query_emb))
 
         # Boost score if query terms appear in title
-        if any(word in r["title"].lower() for word in q.question.lower().split()):
-            score += 0.1
+        for i, title in enumerate(index_titles):
+            if any(word in title for word in words):
+                scores[i] += 0.1
 
-        # Only consider results above threshold
-        if score > 0.30:
-            scored.append((score, r))
+        best = int(np.argmax(scores)) if len(scores) else -1
+        search_time = time.time() - search_start
 
-    # Sort by similarity score and take top result
-    scored = sorted(scored, key=lambda x: x[0], reverse=True)[:1]
-    search_time = time.time() - search_start
+        db_start = time.time()
+        scored = []
+        # Only consider results above threshold
+        if best >= 0 and scores[best] > 0.30:
+            conn = get_pooled_connection()
+            try:
+                cur = conn.cursor(dictionary=True, buffered=True)
+                cur.execute(
+                    "SELECT title, content, url FROM dr_young_all_articles WHERE id=%s",
+                    (int(index_ids[best]),)
+                )
+                row = cur.fetchone()
+            finally:
+                conn.close()  # Return the connection to the pool
+            if row:
+                scored.append((float(scores[best]), row))
+        db_time = time.time() - db_start
+    else:
+        # 2️⃣ Fetch articles from database
+        db_start = time.time()
+        conn = get_pooled_connection()
+        try:
+            cur = conn.cursor(dictionary=True)
+            cur.execute("SELECT title, content, embedding, url FROM dr_young_all_articles")
+            rows = cur.fetchall()
+        finally:
+            conn.close()  # Return the connection to the pool
+        db_time = time.time() - db_start
+
+        # Prepare list to store similarity scores
+        scored = []
+
+        # 3️⃣ Perform vector similarity search
+        search_start = time.time()
+        for r in rows:
+            # Convert stored embedding bytes back to numpy array
+            emb = decode_embedding(r["embedding"])
+            # Calculate cosine similarity with query
+            score = cosine(query_emb, emb)
+
+            # Boost score if query terms appear in title
+            title = r["title"].lower()
+            if any(word in title for word in words):
+                score += 0.1
+
+            # Only consider results above threshold
+            if score > 0.30:
+                scored.append((score, r))
+
+        # Sort by similarity score and take top result
+        scored = sorted(scored, key=lambda x: x[0], reverse=True)[:1]
+        search_time = time.time() - search_start
 
     # Return if no relevant results found
     if not scored:
@@ -13,6 +13,18 @@ Configuration:
   * DB_USER: Database username (default: root)
   * DB_PASSWORD: Database password (default: empty string)
   * DB_NAME: Database name (default: case_studies_db)
+  * DB_POOL_SIZE: Connections kept by get_pooled_connection() (default: 5)
+  * EMBEDDINGS_PARQUET: Optional path of a Parquet snapshot of the embeddings
+  * EMBEDDING_PRECISION: Storage format for new embeddings, float32, float16 or int8 (default: float16)
+
+Embedding storage:
+- Embeddings are stored as raw float16 bytes in a BLOB column; set
+  EMBEDDING_PRECISION=float32 for lossless vectors or int8 for half the size
+- decode_embedding() tells the formats apart by length, and still reads
+  legacy "[0.1, ...]" text
+- export_embeddings()/load_embeddings() keep a columnar Parquet snapshot
+  (id, title, float16 vector) so search can scan one memory-mapped matrix
+  instead of pulling every row from MySQL (requires pyarrow)
 
 Usage:
 - Local development: Works automatically with defaults
@@ -21,12 +33,52 @@ Usage:
 
 # Standard library imports
 import os
+import json
+import threading
 
 # Third-party imports
+import numpy as np      # Embedding (de)serialization
 import mysql.connector  # MySQL database connector
+from mysql.connector import pooling  # Reusable connections for the API
+
+# Optional columnar embedding snapshot
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Output dimension of the all-MiniLM-L6-v2 embedding model
+EMBEDDING_DIM = 384
+
+# Storage precision for new embeddings ("float32", "float16" or "int8")
+EMBEDDING_PRECISION = os.getenv("EMBEDDING_PRECISION", "float16")
+
+# The model's vectors are L2-normalized, so every component lies in [-1, 1]
+# and one fixed scale maps them onto the int8 range for all batches alike
+INT8_SCALE = 127.0
+
+# Parquet snapshot of the embeddings, written by the scraper and read by the API
+EMBEDDINGS_PARQUET = os.getenv("EMBEDDINGS_PARQUET")
+
+# Shared connection pool, created on first use by get_pooled_connection()
+_pool = None
+_pool_lock = threading.Lock()
 
 
-def get_connection():
+def _connection_config():
+    """Connection settings from the environment, with localhost defaults"""
+    return {
+        "host": os.getenv("DB_HOST") or os.getenv("MYSQLHOST", "localhost"),
+        "user": os.getenv("DB_USER") or os.getenv("MYSQLUSER", "root"),
+        "password": os.getenv("DB_PASSWORD") or os.getenv("MYSQLPASSWORD", "2106"),
+        "database": os.getenv("DB_NAME") or os.getenv("MYSQLDATABASE", "case_studies_db"),
+        "port": int(os.getenv("DB_PORT") or os.getenv("MYSQLPORT", "3306")),
+    }
+
+
+def get_connection(allow_local_infile=False):
     """
     Establish and return a connection to the MySQL database
 
@@ -39,6 +91,10 @@ def get_connection():
     - DB_PASSWORD: Database password
     - DB_NAME: Database name
 
+    Args:
+        allow_local_infile (bool): Enable LOAD DATA LOCAL INFILE for bulk
+            loads (off by default; only the scraper needs it)
+
     Returns:
         mysql.connector.connection.MySQLConnection: Database connection object
 
@@ -48,9 +104,153 @@ def get_connection():
         - Cloud: Uses environment variables from platform
     """
     return mysql.connector.connect(
-        host=os.getenv("DB_HOST") or os.getenv("MYSQLHOST", "localhost"),
-        user=os.getenv("DB_USER") or os.getenv("MYSQLUSER", "root"),
-        password=os.getenv("DB_PASSWORD") or os.getenv("MYSQLPASSWORD", "2106"),
-        database=os.getenv("DB_NAME") or os.getenv("MYSQLDATABASE", "case_studies_db"),
-        port=int(os.getenv("DB_PORT") or os.getenv("MYSQLPORT", "3306"))
+        **_connection_config(),
+        allow_local_infile=allow_local_infile
     )
+
+
+def get_pooled_connection():
+    """
+    Borrow a connection from the shared connection pool
+
+    Saves the TCP + authentication handshake that get_connection() pays on
+    every call. Calling close() on the returned connection hands it back to
+    the pool instead of disconnecting, and the pool reconnects connections
+    that the server has dropped.
+
+    Returns:
+        mysql.connector.pooling.PooledMySQLConnection: Pooled database connection
+
+    Raises:
+        mysql.connector.errors.PoolError: If all DB_POOL_SIZE connections are in use
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name="dr_young",
+                    pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+                    **_connection_config()
+                )
+    return _pool.get_connection()
+
+
+def encode_embedding(embedding, precision=None):
+    """
+    Serialize an embedding vector for the BLOB embedding column
+
+    The vector is written as contiguous bytes directly from the numpy array,
+    without an intermediate Python list or string. For 384-dim vectors that
+    is 1536 bytes as float32, 768 as float16 or 384 as int8, instead of
+    ~7 KB of text.
+    int8 uses a fixed symmetric scale (INT8_SCALE), so cosine similarity is
+    preserved up to rounding.
+
+    Args:
+        embedding (numpy.ndarray): L2-normalized embedding vector from the encoder
+        precision (str): "float32", "float16" or "int8" (defaults to EMBEDDING_PRECISION)
+
+    Returns:
+        bytes: Raw float32, float16 or int8 bytes
+
+    Raises:
+        ValueError: If the precision is not supported
+    """
+    precision = precision or EMBEDDING_PRECISION
+    if precision == "int8":
+        scaled = np.rint(np.asarray(embedding, dtype=np.float32) * INT8_SCALE)
+        return np.clip(scaled, -127, 127).astype(np.int8).tobytes()
+    if precision in ("float16", "float32"):
+        return np.ascontiguousarray(embedding, dtype=precision).tobytes()
+    raise ValueError(f"Unsupported embedding precision: {precision}")
+
+
+# Binary embedding formats, keyed by their size in bytes
+_EMBEDDING_DTYPES = {
+    EMBEDDING_DIM: np.int8,
+    EMBEDDING_DIM * 2: np.float16,
+    EMBEDDING_DIM * 4: np.float32,
+}
+
+
+def decode_embedding(value):
+    """
+    Deserialize a stored embedding back into a numpy vector
+
+    Args:
+        value (bytes | bytearray | str): Value of the embedding column: float32,
+            float16 or int8 bytes, or a legacy "[0.1, ...]" text list
+
+    Returns:
+        numpy.ndarray: float32 embedding vector
+    """
+    if isinstance(value, (bytes, bytearray)):
+        dtype = _EMBEDDING_DTYPES.get(len(value))
+        if dtype is not None:
+            vector = np.frombuffer(value, dtype=dtype).astype(np.float32)
+            if dtype is np.int8:
+                vector /= INT8_SCALE
+            return vector
+        # Legacy rows stored the vector as str(list)
+        value = value.decode("ascii")
+    return np.array(json.loads(value), dtype=np.float32)
+
+
+def export_embeddings(path, conn=None):
+    """
+    Write every stored embedding to a Parquet snapshot
+
+    The file has one row per article: id, title and the vector as a
+    fixed-size list of float16, so readers can map the whole matrix at once.
+
+    Args:
+        path (str): Destination .parquet file (replaced atomically)
+        conn: Optional open database connection (a new one is used otherwise)
+
+    Returns:
+        int: Number of embeddings written
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT id, title, embedding FROM dr_young_all_articles")
+        rows = cur.fetchall()
+    finally:
+        if own_conn:
+            conn.close()
+
+    matrix = np.empty((len(rows), EMBEDDING_DIM), dtype=np.float16)
+    for i, (_, _, embedding) in enumerate(rows):
+        matrix[i] = decode_embedding(embedding)
+
+    table = pa.table({
+        "id": pa.array([row[0] for row in rows], type=pa.int64()),
+        "title": pa.array([row[1] or "" for row in rows], type=pa.string()),
+        "embedding": pa.FixedSizeListArray.from_arrays(pa.array(matrix.ravel()), EMBEDDING_DIM),
+    })
+    tmp_path = f"{path}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+def load_embeddings(path):
+    """
+    Load a Parquet snapshot written by export_embeddings()
+
+    Args:
+        path (str): Snapshot .parquet file
+
+    Returns:
+        tuple: (ids, titles, matrix) - int64 id array, list of titles and a
+            float32 (n, EMBEDDING_DIM) embedding matrix
+    """
+    table = pq.read_table(path, memory_map=True)
+    ids = table.column("id").to_numpy()
+    titles = table.column("title").to_pylist()
+    values = table.column("embedding").combine_chunks().flatten().to_numpy()
+    matrix = values.reshape(-1, EMBEDDING_DIM).astype(np.float32)
+    return ids, titles, matrix
@@ -30,6 +30,7 @@ import subprocess    # Execute system commands for Ollama interaction
 import sys           # System-specific parameters and functions
 import platform      # Platform identification for OS-specific handling
 import webbrowser    # Web browser integration for download assistance
+import threading     # Run setup checks while the model downloads
 
 
 def check_ollama():
@@ -50,15 +51,19 @@ def check_ollama():
         return False
 
 
-def download_model(model_name="mistral"):  # Mistral (better quality, faster)
+def download_model(model_name="mistral", on_progress=None):  # Mistral (better quality, faster)
     """
     Download the specified LLM model using Ollama
     
     This function initiates the download process for the requested model
-    through Ollama's command-line interface, showing real-time progress.
+    through Ollama's command-line interface, streaming its progress output
+    line by line instead of blocking on a single subprocess call. Pressing
+    Ctrl-C terminates the pull cleanly.
     
     Args:
         model_name (str): Name of the model to download (default: "mistral")
+        on_progress (callable, optional): Called with each progress line from
+            Ollama. Defaults to rewriting the current console line.
         
     Returns:
         bool: True if download successful, False otherwise
@@ -66,23 +71,67 @@ def download_model(model_name="mistral"):  # Mistral (better quality, faster)
     print(f"📥 Downloading {model_name} model...")
     print("This may take 10-15 minutes depending on your internet speed.")
     
+    if on_progress is None:
+        on_progress = _print_progress
+    
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["ollama", "pull", model_name],
-            capture_output=False,  # Show real-time progress to user
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Merge so progress bars are captured too
+            text=True                  # Universal newlines split "\r" progress updates
         )
-        
-        if result.returncode == 0:
-            print(f"✅ {model_name} downloaded successfully!")
-            return True
-        else:
-            print(f"❌ Failed to download {model_name}")
-            return False
-            
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
+    
+    try:
+        # Pump progress lines as Ollama emits them
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                on_progress(line)
+        returncode = proc.wait()
+    except KeyboardInterrupt:
+        print(f"\n⛔ Download of {model_name} cancelled")
+        proc.terminate()
+        proc.wait()
+        return False
+    finally:
+        proc.stdout.close()
+    
+    print()  # Finish the progress line
+    if returncode == 0:
+        print(f"✅ {model_name} downloaded successfully!")
+        return True
+    else:
+        print(f"❌ Failed to download {model_name}")
+        return False
+
+
+def _print_progress(line):
+    """Rewrite the current console line with the latest Ollama progress output"""
+    print(f"\r{line[:100]:<100}", end="", flush=True)
+
+
+def check_database(result):
+    """
+    Verify that the MySQL database used by the scraper is reachable
+    
+    Runs alongside the model download so database problems are reported
+    without waiting for the pull to finish.
+    
+    Args:
+        result (dict): Receives the outcome under the "ok" and "error" keys
+    """
+    try:
+        from database.db import get_connection
+        conn = get_connection()
+        conn.close()
+        result["ok"] = True
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = e
 
 
 def print_installation_guide():
@@ -180,8 +229,23 @@ def main():
     
     print(f"\nSelected model: {model}")
     
+    # Check the database in the background while the model downloads.
+    # The pull itself stays on the main thread so Ctrl-C can cancel it.
+    db_status = {}
+    db_thread = threading.Thread(target=check_database, args=(db_status,), daemon=True)
+    db_thread.start()
+    
     # Attempt model download and report results
-    if download_model(model):
+    downloaded = download_model(model)
+    
+    db_thread.join()
+    if db_status.get("ok"):
+        print("✅ Database connection OK")
+    else:
+        print(f"⚠️  Database not reachable: {db_status.get('error')}")
+        print("   Check your DB_* settings before running the scraper.")
+    
+    if downloaded:
         print(f"\n🎉 {model} is ready to use!")
         print("You can now run: python backend/main.py")
         return True
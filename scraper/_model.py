@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Shared sentence embedding model for the scraper
+
+get_model() loads all-MiniLM-L6-v2 once per process and hands the same
+instance to every caller, so the ~2-5 s load and the model's memory are paid
+only once (and only by code that actually embeds). torch and
+sentence-transformers are imported on that first load, not at module
+import. The model runs on a CUDA GPU in FP16 when one is available, or
+through an int8 ONNX Runtime export on CPU-only hosts.
+
+Environment variables:
+  * EMBEDDING_ONNX_PATH: Quantized ONNX export of the model (optional)
+  * EMBED_THREADS: CPU threads for inference (default: min(8, CPU count))
+"""
+
+# Standard library imports
+import os
+import logging
+import functools
+
+# Size the CPU thread pools before numpy/torch load: a handful of threads is
+# the sweet spot for MiniLM, more just oversubscribes the cores
+EMBED_THREADS = int(os.getenv("EMBED_THREADS") or min(8, os.cpu_count() or 1))
+os.environ.setdefault("OMP_NUM_THREADS", str(EMBED_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(EMBED_THREADS))
+
+# Third-party imports
+import numpy as np                 # Pooling for the ONNX embedding backend
+
+# Optional ONNX Runtime backend for faster int8 embeddings on CPU-only hosts
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Local imports
+from database.db import EMBEDDING_DIM
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+ONNX_MODEL_PATH = os.getenv("EMBEDDING_ONNX_PATH")  # Quantized model, e.g. onnx_minilm/model.int8.onnx
+EMBED_BATCH_SIZE = 64     # Articles per encoder forward pass
+
+
+def _load_sentence_transformer():
+    """
+    Import torch, size its thread pools and load the SentenceTransformer model
+    
+    Returns:
+        tuple: (SentenceTransformer, device name)
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    # Intra-op threads parallelize the GEMMs; one inter-op thread since the
+    # encoder graph is sequential
+    torch.set_num_threads(EMBED_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Other torch code in this process already started the inter-op pool
+        logger.debug("torch inter-op thread pool already started, keeping its size")
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"  # Embed on GPU when available
+    return SentenceTransformer("all-MiniLM-L6-v2", device=device), device
+
+
+class Embedder:
+    """
+    all-MiniLM-L6-v2 sentence embedder with an optional int8 ONNX Runtime backend
+    
+    When EMBEDDING_ONNX_PATH points to a dynamically quantized ONNX export of
+    the model and onnxruntime is installed, inference runs through ONNX
+    Runtime (int8 GEMMs on EMBED_THREADS cores) with the same mean pooling and L2
+    normalization as sentence-transformers. Otherwise it falls back to the
+    regular SentenceTransformer model, which runs in FP16 on a CUDA GPU
+    when one is available.
+    """
+
+    def __init__(self, onnx_path=None):
+        self.session = None
+        if onnx_path and ONNXRUNTIME_AVAILABLE and os.path.exists(onnx_path):
+            from transformers import AutoTokenizer
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = EMBED_THREADS
+            self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+            self.input_names = {i.name for i in self.session.get_inputs()}
+            self.tokenizer = AutoTokenizer.from_pretrained(EMBEDDING_MODEL)
+            logger.info(f"🧠 Using ONNX Runtime embedder: {onnx_path}")
+        else:
+            if onnx_path:
+                logger.warning(f"⚠️ ONNX model unavailable ({onnx_path}), using sentence-transformers")
+            self.model, device = _load_sentence_transformer()
+            if device == "cuda":
+                self.model = self.model.half()
+            logger.info(f"🧠 Using sentence-transformers embedder on {device}")
+
+    def encode(self, texts, batch_size=EMBED_BATCH_SIZE):
+        """
+        Embed one text or a list of texts
+        
+        Lists are encoded in mini-batches of similar length to minimize
+        padding (sentence-transformers does the same internally).
+        
+        Args:
+            texts (str | list): Text(s) to embed
+            batch_size (int): Texts per forward pass
+            
+        Returns:
+            numpy.ndarray: Embedding vector, or matrix with one row per text
+        """
+        if self.session is None:
+            return self.model.encode(texts, batch_size=batch_size, show_progress_bar=False,
+                                     convert_to_numpy=True, normalize_embeddings=True)
+
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        order = np.argsort([-len(t) for t in batch], kind="stable")
+        pooled = np.empty((len(batch), EMBEDDING_DIM), dtype=np.float32)
+        for start in range(0, len(batch), batch_size):
+            idx = order[start:start + batch_size]
+            pooled[idx] = self._encode_batch([batch[i] for i in idx])
+        return pooled[0] if single else pooled
+
+    def _encode_batch(self, batch):
+        """Run one padded mini-batch through the ONNX session"""
+        encoded = self.tokenizer(batch, padding=True, truncation=True,
+                                 max_length=256, return_tensors="np")
+        feeds = {name: encoded[name].astype(np.int64)
+                 for name in self.input_names if name in encoded}
+        token_embeddings = self.session.run(None, feeds)[0]
+
+        # Mean pooling over real tokens, then L2 normalization
+        mask = encoded["attention_mask"][..., None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled
+
+
+@functools.lru_cache(maxsize=1)
+def get_model():
+    """
+    Return the process-wide embedding model, loading it on first use
+    
+    Not synchronized: callers on several threads should hold a lock around
+    their first call (the scraper's model_lock does).
+    
+    Returns:
+        Embedder: Shared all-MiniLM-L6-v2 embedder
+    """
+    return Embedder(ONNX_MODEL_PATH)
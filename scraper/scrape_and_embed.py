@@ -10,7 +10,7 @@ Features:
 - Extracts clean article content with noise filtering
 - Generates semantic embeddings using sentence-transformers
 - Stores structured data in MySQL database
-- Handles rate limiting and respectful scraping practices
+- Handles per-host rate limiting and respectful scraping practices
 - Supports multiple content sources and categories
 
 Scraping Sources:
@@ -29,19 +29,51 @@ import time           # Timing and delays for respectful scraping
 import logging        # Logging for monitoring and debugging
 import warnings       # Warning suppression for cleaner output
 import re             # Regular expressions for pattern matching
-from urllib.parse import urljoin  # URL joining utilities
+import functools      # Cache per-category regexes
+import hashlib        # Content hashing for duplicate detection
+import tempfile       # Staging files for bulk loads
+import threading      # Serialize access to the shared embedding model
+from concurrent.futures import ThreadPoolExecutor  # Scrape both sites concurrently
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode  # URL utilities
 
 # Third-party imports
 import requests                    # HTTP requests for web scraping
-from bs4 import BeautifulSoup     # HTML parsing and content extraction
-from sentence_transformers import SentenceTransformer  # Vector embedding generation
+from requests.adapters import HTTPAdapter  # Connection pooling per host
+from urllib3.util.retry import Retry       # Retry transient HTTP failures
+from urllib3.util.request import ACCEPT_ENCODING  # Compressions urllib3 can decode here
+from bs4 import BeautifulSoup, SoupStrainer, Tag  # HTML parsing and content extraction
+
+# Optional on-disk HTTP cache for development re-runs
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional C HTML parser for article pages (several times faster than bs4).
+# The Lexbor backend is the one current selectolax releases ship; older
+# releases only have the Modest-based parser module.
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
 
 # Local imports
 import sys
 import os
-# Add parent directory to path to import database module
+# Add parent directory to path to import the scraper and database packages
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from database.db import get_connection  # Database connection utility
+# Imported before database.db so the thread settings apply before numpy loads
+from scraper._model import get_model  # Shared embedding model
+from database.db import (  # Database utilities
+    get_connection, encode_embedding, export_embeddings,
+    EMBEDDINGS_PARQUET, PYARROW_AVAILABLE,
+)
 
 # Suppress SSL warnings for cleaner output during scraping
 warnings.filterwarnings("ignore")
@@ -58,8 +90,257 @@ DR_YOUNG_BLOG_URL = "https://drrobertyoung.com/blog/"
 MAIN_WORDPRESS_URL = "https://phoreveryoung.wordpress.com/"
 HEADERS = {"User-Agent": "Mozilla/5.0 (MultiSiteBot/1.0)"}  # Identify bot properly
 MIN_CONTENT_LENGTH = 300  # Minimum content length to store an article (characters)
-PAGE_DELAY = 1            # Delay between pages (seconds) for rate limiting
-ARTICLE_DELAY = 2         # Delay between articles (seconds) for respectful scraping
+REQUESTS_PER_SECOND = 2   # Sustained request rate allowed per host
+REQUEST_BURST = 4         # Requests per host that may start back-to-back before throttling
+MAX_REQUEST_INTERVAL = 30.0  # Slowest per-host spacing (seconds) after repeated 429/503s
+THROTTLE_STATUSES = {429, 503}  # Responses that mean "slow down"
+DETAIL_WORKERS = 4        # Concurrent article fetches per listing page
+# The encoder only sees the first 256 tokens. 256 tokens x 16 characters (a
+# generous upper bound on characters per token) bounds how much text those
+# tokens can span, so characters past this are never seen by the encoder
+MAX_EMBED_CHARS = 256 * 16
+# Article pages only need the content containers, titles and text elements;
+# parsing just these skips scripts, styles, headers and sidebars
+ARTICLE_STRAINER = SoupStrainer(["article", "div", "main", "h1", "h2", "h3", "h4", "p", "li"])
+CONTENT_SELECTOR = "p, h1, h2, h3, h4, li"  # Text-containing elements of an article
+# Discovery pages are only mined for links; category listings only need the
+# article cards and the "next" pagination link
+LINK_STRAINER = SoupStrainer("a", href=True)
+LISTING_STRAINER = SoupStrainer(["article", "a"])
+BULK_LOAD_MIN_ROWS = 100  # Batches at least this large use LOAD DATA LOCAL INFILE
+HTTP_CACHE = os.getenv("SCRAPER_HTTP_CACHE")  # SQLite cache file for fetched pages, e.g. .http_cache
+HTTP_CACHE_TTL = int(os.getenv("SCRAPER_HTTP_CACHE_TTL", "86400"))  # Seconds before a cached page is refetched
+
+# Phrases marking footer/menu/sharing text rather than article content;
+# compiled into one case-insensitive pattern so each paragraph is scanned once
+SKIP_PHRASES = [
+    "share this", "related", "author", "posted on", "subscribe",
+    "navigation", "footer", "copyright", "all rights reserved",
+    "privacy policy", "terms of service", "cookie", "menu",
+    "search", "leave a comment", "reply", "previous post",
+    "next post", "facebook", "twitter", "linkedin", "email"
+]
+SKIP_RE = re.compile("|".join(re.escape(p) for p in SKIP_PHRASES), re.IGNORECASE)
+
+# Link and class patterns, compiled once at import
+WP_CATEGORY_RE = re.compile(r'https://phoreveryoung\.wordpress\.com/category/')
+CATEGORY_CLASS_RE = re.compile(r'category-[\w-]+')
+DRY_CATEGORY_RE = re.compile(r'https://drrobertyoung\.com/[^/]+/$')
+DRY_LINK_RE = re.compile(r'https://drrobertyoung\.com/')
+DRY_POST_RE = re.compile(r'https://drrobertyoung\.com/[^/]+/[^/]+/$')
+POST_CLASS_RE = re.compile(r'post')
+# Blog links that point at archives, anchors, queries or images rather than posts
+NON_ARTICLE_LINK_RE = re.compile("|".join(
+    re.escape(p) for p in ['/category/', '/tag/', '/page/', '#', '?', '.jpg', '.png']))
+
+
+# Shared HTTP session: keep-alive connections are pooled per host, so only the
+# first request to each site pays the TCP + TLS handshake. With
+# SCRAPER_HTTP_CACHE set, pages are also cached on disk so re-runs within
+# the TTL never touch the network.
+if HTTP_CACHE and REQUESTS_CACHE_AVAILABLE:
+    SESSION = requests_cache.CachedSession(
+        HTTP_CACHE,
+        backend="sqlite",
+        expire_after=HTTP_CACHE_TTL,
+        allowable_methods=("GET", "HEAD"),
+        stale_if_error=True,
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+# Advertise every compression urllib3 can decode, including brotli when a
+# brotli package is installed (requests itself only offers gzip/deflate)
+SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+class RateLimiter:
+    """
+    Adaptive per-host token bucket: `rate` requests per second, bursts of up to `burst`
+    
+    A host that has been idle lets a page's detail fetches start together,
+    and only sustained traffic is spaced 1/rate seconds apart. acquire()
+    reserves the caller's slot under a lock (a virtual-scheduling token
+    bucket, no refill thread) and sleeps outside it, so threads hitting the
+    same host wait in parallel for their own slots. Time spent fetching and
+    parsing counts towards the budget.
+    
+    When the host pushes back (429/503), slow_down() doubles the spacing and
+    disables bursts; each normal response lets speed_up() ease it back
+    towards the base rate. Concurrent fetches tend to be throttled together,
+    so the spacing doubles at most once per interval: the other in-flight
+    429s of the same burst do not compound it.
+    """
+
+    def __init__(self, rate, burst=1, max_interval=MAX_REQUEST_INTERVAL):
+        self.base_interval = 1.0 / rate
+        self.interval = self.base_interval
+        self.max_interval = max_interval
+        self.burst = burst
+        self._next = 0.0  # When the bucket would be empty at the current rate
+        self._last_backoff = float("-inf")  # When slow_down() last doubled the spacing
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until this caller's request slot for the host arrives"""
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(self._next, now)
+            # Bursts are only allowed while the host is not pushing back
+            burst_window = (self.burst - 1) * self.interval if self.interval == self.base_interval else 0.0
+            delay = max(0.0, scheduled - burst_window - now)
+            self._next = scheduled + self.interval
+        if delay:
+            time.sleep(delay)
+
+    def slow_down(self):
+        """Back off exponentially after the host signalled overload"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_backoff < self.interval:
+                return  # Already backed off for this burst of throttled responses
+            self._last_backoff = now
+            self.interval = interval = min(self.interval * 2, self.max_interval)
+        logger.warning(f"🐢 Host is throttling, spacing requests {interval:.1f}s apart")
+
+    def speed_up(self):
+        """Ease back towards the base rate after a normal response"""
+        with self._lock:
+            if self.interval > self.base_interval:
+                self.interval = max(self.base_interval, self.interval * 0.9)
+
+
+# One limiter per host so the two sites never share a request budget
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(url):
+    """
+    Return the rate limiter for a URL's host, creating it on first use
+    
+    Args:
+        url (str): Request URL
+        
+    Returns:
+        RateLimiter: Limiter shared by all requests to that host
+    """
+    host = urlparse(url).hostname
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = RateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
+        return _limiters[host]
+
+
+def fresh_in_cache(url, **kwargs):
+    """
+    Whether the HTTP cache holds an unexpired response for a GET of a URL
+    
+    Stale entries do not count: requests-cache refetches them (or at most
+    revalidates), which is real traffic to the site.
+    
+    Args:
+        url (str): URL about to be fetched
+        **kwargs: The params/headers the request will be sent with
+        
+    Returns:
+        bool: True when SESSION.get() will be answered from the cache
+    """
+    if not hasattr(SESSION, "cache"):
+        return False
+    request = SESSION.prepare_request(
+        requests.Request("GET", url, params=kwargs.get("params"), headers=kwargs.get("headers"))
+    )
+    cached = SESSION.cache.get_response(SESSION.cache.create_key(request))
+    return cached is not None and not cached.is_expired
+
+
+def polite_get(url, timeout=15, **kwargs):
+    """
+    GET a URL through the shared session after waiting for the host's rate limiter
+    
+    Pages with a fresh entry in the HTTP cache are served without waiting,
+    since they cost the site nothing; expired entries wait like any fetch. 429/503 responses (including ones the adapter
+    retried) slow the host's limiter down; other responses speed it back up.
+    
+    Args:
+        url (str): URL to fetch
+        timeout (int): Request timeout in seconds
+        **kwargs: Extra arguments passed to SESSION.get
+        
+    Returns:
+        requests.Response: HTTP response
+    """
+    limiter = get_limiter(url)
+    if not fresh_in_cache(url, **kwargs):
+        limiter.acquire()
+    try:
+        response = SESSION.get(url, timeout=timeout, **kwargs)
+    except requests.exceptions.RetryError:
+        limiter.slow_down()  # Retries exhausted on throttling/server errors
+        raise
+
+    # The adapter retries 429/503 internally; its history shows if it had to
+    retries = getattr(response.raw, "retries", None)
+    history = getattr(retries, "history", ()) or ()
+    if response.status_code in THROTTLE_STATUSES or any(h.status in THROTTLE_STATUSES for h in history):
+        limiter.slow_down()
+    else:
+        limiter.speed_up()
+    return response
+
+
+def fetch_details(urls, parse=None, timeout=10):
+    """
+    Fetch (and optionally parse) article detail pages concurrently
+    
+    Up to DETAIL_WORKERS requests are in flight at once so their network
+    round-trips overlap; the per-host rate limiter still spaces their start
+    times. A parse callback runs in the worker thread as soon as its page
+    arrives, so parsing one page overlaps with downloading the others.
+    
+    Args:
+        urls (list): Article URLs to fetch
+        parse (callable): Optional parse(html) applied to each raw body
+        timeout (int): Request timeout in seconds
+        
+    Returns:
+        list: (url, result) pairs in input order; result is parse(html), or
+            the raw body bytes without a parser, or None if the fetch or
+            parse failed
+    """
+    def fetch(url):
+        try:
+            html = polite_get(url, timeout=timeout).content
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to fetch article {url}: {e}")
+            return url, None
+        if not parse:
+            return url, html
+        try:
+            return url, parse(html)
+        except Exception as e:
+            # One malformed page must not abort the rest of the batch
+            logger.warning(f"⚠️ Failed to parse article {url}: {e}")
+            return url, None
+
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS, thread_name_prefix="fetch") as executor:
+        return list(executor.map(fetch, urls))
+
+
+@functools.lru_cache(maxsize=64)
+def _subcat_re(slug):
+    """Compiled pattern matching subcategory links under a category, capturing the subcategory"""
+    return re.compile(rf'https://phoreveryoung\.wordpress\.com/category/{re.escape(slug)}/([^/"]+)/')
 
 
 def discover_subcategories(main_category_slug):
@@ -77,19 +358,18 @@ def discover_subcategories(main_category_slug):
     
     try:
         logger.info(f"🔍 Discovering subcategories in: {main_category_slug}")
-        response = requests.get(main_category_url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = polite_get(main_category_url)
+        soup = BeautifulSoup(response.content, "lxml", parse_only=LINK_STRAINER)
         
         # Look for subcategory links
-        subcategory_links = soup.find_all('a', href=re.compile(
-            rf'https://phoreveryoung\.wordpress\.com/category/{re.escape(main_category_slug)}/[^/"]+/'))
+        subcat_re = _subcat_re(main_category_slug)
+        subcategory_links = soup.find_all('a', href=subcat_re)
         
         for link in subcategory_links:
             href = link.get('href')
             if href:
                 # Extract subcategory name
-                pattern = rf'https://phoreveryoung\.wordpress\.com/category/{re.escape(main_category_slug)}/([^/"]+)/'
-                match = re.search(pattern, href)
+                match = subcat_re.search(href)
                 if match:
                     subcategory = match.group(1)
                     if subcategory and subcategory not in ['feed', 'page']:
@@ -118,13 +398,13 @@ def discover_all_categories():
     
     try:
         # Fetch the main WordPress page
-        response = requests.get(MAIN_WORDPRESS_URL, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = polite_get(MAIN_WORDPRESS_URL)
+        soup = BeautifulSoup(response.content, "lxml")
         
         categories_found = set()
         
         # Method 1: Find category links in navigation/menu
-        nav_links = soup.find_all('a', href=re.compile(r'https://phoreveryoung\.wordpress\.com/category/'))
+        nav_links = soup.find_all('a', href=WP_CATEGORY_RE)
         for link in nav_links:
             href = link.get('href')
             if href and '/category/' in href:
@@ -134,7 +414,7 @@ def discover_all_categories():
                     categories_found.add(category_part)
         
         # Method 2: Find category links in article meta data
-        article_links = soup.find_all('a', href=re.compile(r'https://phoreveryoung\.wordpress\.com/category/'), rel="category tag")
+        article_links = soup.find_all('a', href=WP_CATEGORY_RE, rel="category tag")
         for link in article_links:
             href = link.get('href')
             if href and '/category/' in href:
@@ -143,7 +423,7 @@ def discover_all_categories():
                     categories_found.add(category_part)
         
         # Method 3: Look for category classes in HTML
-        category_elements = soup.find_all(class_=re.compile(r'category-[\w-]+'))
+        category_elements = soup.find_all(class_=CATEGORY_CLASS_RE)
         for elem in category_elements:
             # Extract category from class names
             classes = elem.get('class', [])
@@ -164,11 +444,11 @@ def discover_all_categories():
         all_categories_with_subcategories = main_categories.copy()
         
         logger.info("\n🔍 DISCOVERING SUBCATEGORIES...")
-        for main_cat in main_categories:
-            subcats = discover_subcategories(main_cat)
-            all_categories_with_subcategories.extend(subcats)
-            # Small delay between subcategory discoveries
-            time.sleep(1)
+        # Category pages are independent, so fetch them concurrently (the
+        # per-host rate limiter still paces the requests)
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS, thread_name_prefix="discover") as executor:
+            for subcats in executor.map(discover_subcategories, main_categories):
+                all_categories_with_subcategories.extend(subcats)
         
         # Remove duplicates and sort
         final_categories = sorted(list(set(all_categories_with_subcategories)))
@@ -205,21 +485,95 @@ def discover_all_categories():
             "retreats"
         ]
 
-# Initialize sentence transformer model for embeddings
-# Using all-MiniLM-L6-v2 for efficient sentence embeddings (22.7M parameters)
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# Both site scrapers share the model; its fast tokenizer is not safe to call
+# from two threads at once, so encodes (and the first load) are serialized
+model_lock = threading.Lock()
+
+
+def embed(contents):
+    """
+    Generate embeddings for a batch of articles in one encoder call
+    
+    Contents are clipped to MAX_EMBED_CHARS first, so long articles are not
+    tokenized in full only to be truncated to 256 tokens. Safe to call from
+    any scraper thread.
+    
+    Args:
+        contents (list): Cleaned article contents
+        
+    Returns:
+        numpy.ndarray: Embedding matrix with one row per article
+    """
+    clipped = [content[:MAX_EMBED_CHARS] for content in contents]
+    with model_lock:
+        return get_model().encode(clipped)
+
+
+def build_rows(pending):
+    """
+    Embed a page's pending articles in one batch and build insert rows
+    
+    Args:
+        pending (list): (title, url, content) tuples
+        
+    Returns:
+        list: (title, url, content, embedding_bytes) tuples for insert_articles()
+    """
+    if not pending:
+        return []
+    embeddings = embed([content for _, _, content in pending])
+    return [(title, url, content, encode_embedding(embedding))
+            for (title, url, content), embedding in zip(pending, embeddings)]
+
+
+def _select_one(node, selector):
+    """First match of a CSS selector in a BeautifulSoup or selectolax node, or None"""
+    # Dispatch on type: bs4 turns any unknown attribute into a child-tag
+    # lookup, so hasattr() checks are true for every Tag
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+
+def _select(node, selector):
+    """All matches of a CSS selector in a BeautifulSoup or selectolax node"""
+    if isinstance(node, Tag):
+        return node.select(selector)
+    return node.css(selector)
+
+
+def _text(node, separator=""):
+    """Stripped text of a BeautifulSoup or selectolax node"""
+    if isinstance(node, Tag):
+        return node.get_text(separator, strip=True)
+    return node.text(separator=separator, strip=True)
+
+
+def parse_article(html):
+    """
+    Parse an article page with selectolax when installed, else bs4 + lxml
+    
+    Args:
+        html (bytes): Raw page body
+        
+    Returns:
+        HTMLParser | BeautifulSoup: Document for the title and content extractors
+    """
+    if SELECTOLAX_AVAILABLE:
+        return HTMLParser(html)
+    return BeautifulSoup(html, "lxml", parse_only=ARTICLE_STRAINER)
 
 
 def extract_clean_article_content(soup):
     """
-    Extract clean article content from a BeautifulSoup object
+    Extract clean article content from a parsed article page
     
     This function attempts to find the main content of an article by trying various
     common HTML selectors and filtering out unwanted elements like navigation,
     advertisements, and footer content.
     
     Args:
-        soup (BeautifulSoup): Parsed HTML document
+        soup (HTMLParser | BeautifulSoup): Document from parse_article()
         
     Returns:
         str: Cleaned article content or empty string if no content found
@@ -234,7 +588,7 @@ def extract_clean_article_content(soup):
 
     content_root = None
     for sel in selectors:
-        content_root = soup.select_one(sel)
+        content_root = _select_one(soup, sel)
         if content_root:
             break
 
@@ -242,60 +596,442 @@ def extract_clean_article_content(soup):
     if not content_root:
         return ""
 
-    # Extract text from common content elements
-    elements = content_root.find_all(
-        ["p", "h1", "h2", "h3", "h4", "li"],  # Text-containing elements
-        recursive=True
-    )
-
+    # Extract text from common content elements in one selector pass,
+    # filtering as we go instead of building intermediate lists
     content_parts = []
-    for el in elements:
-        text = el.get_text(" ", strip=True)
+    for el in _select(content_root, CONTENT_SELECTOR):
+        text = _text(el, " ")
 
-        # Skip short texts that are likely navigation or formatting
-        if len(text) < 30:
-            continue
-
-        # Skip unwanted content sections commonly found in footers/menus
-        if any(skip in text.lower() for skip in [
-            "share this", "related", "author", "posted on", "subscribe",
-            "navigation", "footer", "copyright", "all rights reserved",
-            "privacy policy", "terms of service", "cookie", "menu",
-            "search", "leave a comment", "reply", "previous post",
-            "next post", "facebook", "twitter", "linkedin", "email"
-        ]):
+        # Skip short texts that are likely navigation or formatting (cheap
+        # length check first), then sections common in footers/menus
+        if len(text) < 30 or SKIP_RE.search(text):
             continue
 
         content_parts.append(text)
 
     return "\n".join(content_parts)
 
-# Establish database connection and cursor
-conn = get_connection()
-cur = conn.cursor()
-
-# Create articles table if it doesn't exist
-cur.execute("""
-CREATE TABLE IF NOT EXISTS dr_young_all_articles (
-    id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
-    title TEXT,
-    url TEXT UNIQUE,
-    content LONGTEXT,
-    embedding LONGTEXT
-)
-""")
-conn.commit()
+def setup_db():
+    """
+    Connect to the database and make sure the articles table exists
+    
+    Creates the dr_young_all_articles table when missing and migrates older
+    tables in place (content hash column). Called from main() so importing
+    this module never opens a connection or issues DDL.
+    
+    Returns:
+        tuple: (connection, cursor) ready for scraping
+    """
+    # Establish database connection and cursor (local infile enables bulk loads)
+    conn = get_connection(allow_local_infile=True)
+    # Buffered, so single-row fetchone() lookups never leave unread results
+    cur = conn.cursor(buffered=True)
+
+    # Create articles table if it doesn't exist
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS dr_young_all_articles (
+        id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        title TEXT,
+        url TEXT,
+        content LONGTEXT,
+        embedding BLOB NOT NULL,
+        content_sha BINARY(20) GENERATED ALWAYS AS (UNHEX(SHA1(content))) STORED,
+        UNIQUE KEY uq_url (url(512)),
+        UNIQUE KEY uq_content_sha (content_sha)
+    )
+    """)
+    conn.commit()
+
+    # Add the content hash column to tables created before it existed
+    cur.execute("""
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'dr_young_all_articles'
+          AND COLUMN_NAME = 'content_sha'
+    """)
+    if not cur.fetchone()[0]:
+        cur.execute("""
+            ALTER TABLE dr_young_all_articles
+            ADD COLUMN content_sha BINARY(20) GENERATED ALWAYS AS (UNHEX(SHA1(content))) STORED
+        """)
+        try:
+            cur.execute("ALTER TABLE dr_young_all_articles ADD UNIQUE KEY uq_content_sha (content_sha)")
+        except Exception as e:
+            # Existing duplicate rows prevent a UNIQUE key; a plain index still serves the lookups
+            logger.warning(f"⚠️ Could not add UNIQUE key on content_sha ({e}), using a plain index")
+            cur.execute("ALTER TABLE dr_young_all_articles ADD INDEX idx_content_sha (content_sha)")
+        conn.commit()
+
+    # Older tables may lack a unique key on url (TEXT UNIQUE needs a prefix
+    # length on MySQL); INSERT IGNORE relies on it to drop re-scraped URLs
+    cur.execute("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'dr_young_all_articles'
+          AND COLUMN_NAME = 'url'
+          AND NON_UNIQUE = 0
+    """)
+    if not cur.fetchone()[0]:
+        try:
+            cur.execute("ALTER TABLE dr_young_all_articles ADD UNIQUE KEY uq_url (url(512))")
+            conn.commit()
+        except Exception as e:
+            # Existing duplicate URLs prevent the key; the in-memory index still skips them
+            logger.warning(f"⚠️ Could not add UNIQUE key on url ({e})")
+
+    # Embeddings are stored as float16 bytes; convert the legacy text column
+    # (old text rows keep their bytes and are still readable by decode_embedding)
+    cur.execute("""
+        SELECT DATA_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'dr_young_all_articles'
+          AND COLUMN_NAME = 'embedding'
+    """)
+    row = cur.fetchone()
+    data_type = row[0] if row else ""
+    if isinstance(data_type, (bytes, bytearray)):
+        data_type = data_type.decode()
+    if data_type.lower() in ("text", "mediumtext", "longtext"):
+        cur.execute("ALTER TABLE dr_young_all_articles MODIFY embedding BLOB")
+        conn.commit()
+
+    # Index creation commented out due to MariaDB compatibility issues
+    # cur.execute("CREATE INDEX IF NOT EXISTS idx_content_length ON dr_young_all_articles((CHAR_LENGTH(content)));")
+    # conn.commit()
+
+    return conn, cur
+
+
+def content_hash(content):
+    """
+    Compute the SHA1 digest matching the generated content_sha column
+    
+    Args:
+        content (str): Cleaned article content
+        
+    Returns:
+        bytes: 20-byte SHA1 digest of the UTF-8 encoded content
+    """
+    return hashlib.sha1(content.encode("utf-8")).digest()
+
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+
+def canonical_url(url):
+    """
+    Normalize an article URL so its variants collapse to one key
+    
+    Lowercases the scheme and host, drops the fragment and tracking query
+    parameters, and gives extension-less paths WordPress's trailing slash
+    (the form stored for existing rows).
+    
+    Args:
+        url (str): Article URL as found in a page
+        
+    Returns:
+        str: Canonical URL
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path or "/"
+    if not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+        path += "/"
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not key.startswith(TRACKING_PARAM_PREFIXES)])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
 
-# Index creation commented out due to MariaDB compatibility issues
-# cur.execute("CREATE INDEX IF NOT EXISTS idx_content_length ON dr_young_all_articles((CHAR_LENGTH(content)));")
-# conn.commit()
+
+class KnownArticles:
+    """
+    In-memory index of the URLs and content hashes already stored
+    
+    Loaded once per run so the scrapers can skip known articles without a
+    database round-trip per link; the unique keys on the table remain the
+    backstop for anything that slips through.
+    """
+    
+    def __init__(self, cur):
+        cur.execute("SELECT url, content_sha FROM dr_young_all_articles")
+        self.urls = set()
+        self.hashes = set()
+        for url, sha in cur.fetchall():
+            if url:  # Rows without a URL (e.g. manually added Q&A) have nothing to match
+                self.urls.add(canonical_url(url))
+            if sha is not None:
+                self.hashes.add(bytes(sha))
+        logger.info(f"📚 Loaded {len(self.urls)} known articles")
+    
+    def has_url(self, url):
+        """Return True if an article with this (canonical) URL is already stored"""
+        return url in self.urls
+    
+    def has_content(self, content_sha):
+        """Return True if identical content is already stored (possibly under another URL)"""
+        return content_sha in self.hashes
+    
+    def add_rows(self, rows):
+        """Record freshly inserted (title, url, content, embedding) rows"""
+        for _, url, content, _ in rows:
+            self.urls.add(url)
+            self.hashes.add(content_hash(content))
+
+
+def _escape_tsv_field(value):
+    """Escape a value for LOAD DATA's default tab-separated format"""
+    if isinstance(value, bytes):
+        return value.hex()  # Binary columns are loaded through UNHEX()
+    return (str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+            .replace("\0", "\\0"))
+
+
+def bulk_load_articles(cur, rows):
+    """
+    Insert a large batch of articles with LOAD DATA LOCAL INFILE
+    
+    The rows are staged in a temporary tab-separated file so MySQL's bulk
+    loader can ingest them in one statement instead of parsing each row.
+    Duplicate URLs/content are skipped by the unique keys (IGNORE).
+    
+    Args:
+        cur: Database cursor (connection opened with allow_local_infile)
+        rows (list): (title, url, content, embedding) tuples
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="\n",
+                                     suffix=".tsv", delete=False) as f:
+        for row in rows:
+            f.write("\t".join(_escape_tsv_field(v) for v in row))
+            f.write("\n")
+        path = f.name
+    try:
+        cur.execute("""
+            LOAD DATA LOCAL INFILE %s
+            IGNORE INTO TABLE dr_young_all_articles
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+            LINES TERMINATED BY '\\n'
+            (title, url, content, @embedding)
+            SET embedding = UNHEX(@embedding)
+        """, (path,))
+        return cur.rowcount
+    finally:
+        os.unlink(path)
+
+
+def insert_articles(conn, cur, rows):
+    """
+    Insert a batch of scraped articles in a single transaction
+    
+    Small batches go through executemany; batches of BULK_LOAD_MIN_ROWS or
+    more use LOAD DATA LOCAL INFILE, falling back to executemany if the
+    server does not allow local infile.
+    
+    Args:
+        conn: Database connection
+        cur: Database cursor
+        rows (list): (title, url, content, embedding) tuples
+        
+    Returns:
+        int: Number of rows inserted (duplicates are ignored)
+    """
+    if not rows:
+        return 0
+
+    if len(rows) >= BULK_LOAD_MIN_ROWS:
+        try:
+            inserted = bulk_load_articles(cur, rows)
+            conn.commit()
+            return inserted
+        except Exception as e:
+            logger.warning(f"⚠️ Bulk load failed ({e}), falling back to executemany")
+            conn.rollback()
+
+    # One multi-row INSERT and one commit per batch; roll back the whole
+    # batch on failure so a bad row never leaves a half-written page
+    try:
+        cur.executemany("""
+            INSERT IGNORE INTO dr_young_all_articles
+            (title, url, content, embedding)
+            VALUES (%s, %s, %s, %s)
+        """, rows)
+        inserted = cur.rowcount  # Rows dropped as duplicates are not counted
+        conn.commit()
+        return inserted
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"❌ Failed to insert batch of {len(rows)} articles: {e}")
+        return 0
 
 
-def scrape_single_category(category_slug):
+def wordpress_title(detail_soup):
+    """
+    Extract the article title from a phoreveryoung.wordpress.com post
+    
+    Args:
+        detail_soup (HTMLParser | BeautifulSoup): Document from parse_article()
+        
+    Returns:
+        str: Article title or "Untitled"
+    """
+    # First try entry-title class (WordPress standard)
+    title_elem = _select_one(detail_soup, ".entry-title")
+    
+    # If not found, try the first h1 that is not the site header
+    if not title_elem:
+        h1_tags = _select(detail_soup, "h1")
+        # Skip the first h1 if it contains site name
+        for h1 in h1_tags:
+            text = _text(h1)
+            if text and "pHorever Young" not in text and "Blog" not in text:
+                title_elem = h1
+                break
+        # If all h1 tags contain site name, use the first one
+        if not title_elem and h1_tags:
+            title_elem = h1_tags[0]
+    
+    return _text(title_elem) if title_elem else "Untitled"
+
+
+def blog_title(detail_soup):
+    """
+    Extract the article title from a drrobertyoung.com post
+    
+    Args:
+        detail_soup (HTMLParser | BeautifulSoup): Document from parse_article()
+        
+    Returns:
+        str: Article title or "Untitled"
+    """
+    title_elem = _select_one(detail_soup, "h1") or _select_one(detail_soup, ".entry-title")
+    return _text(title_elem) if title_elem else "Untitled"
+
+
+class ArticleScraper:
+    """
+    Shared article pipeline for both sites
+    
+    Given the article URLs found on a listing page, skips known URLs, fetches
+    the rest concurrently, extracts title and content, drops short or
+    duplicate content, then embeds the page's articles in one batch and
+    inserts them. Each site thread gets its own instance (and connection);
+    the KnownArticles index is shared between them.
+    """
+    
+    def __init__(self, conn, cur, known):
+        """
+        Args:
+            conn: Database connection
+            cur: Database cursor
+            known (KnownArticles): Index of stored URLs and content hashes
+        """
+        self.conn = conn
+        self.cur = cur
+        self.known = known
+    
+    def new_urls(self, urls):
+        """
+        Canonicalize candidate URLs and drop repeats and already stored articles
+        
+        Args:
+            urls (iterable): Candidate article URLs
+            
+        Returns:
+            list: Canonical URLs not yet in the database, in first-seen order
+        """
+        fresh = []
+        for url in dict.fromkeys(canonical_url(url) for url in urls):
+            if self.known.has_url(url):
+                logger.debug(f"⏭️ Skipping existing article by URL: {url}")
+                continue
+            fresh.append(url)
+        return fresh
+    
+    def collect(self, urls, label, extract_title):
+        """
+        Fetch article pages concurrently and keep the ones worth embedding
+        
+        Args:
+            urls (list): Article URLs not yet in the database
+            label (str): Category name used in log messages
+            extract_title (callable): Returns the title from a parsed article page
+            
+        Returns:
+            list: (title, url, content) tuples ready for persist()
+        """
+        def parse(html):
+            # Runs on the fetch workers; only the extracted strings come back
+            detail_soup = parse_article(html)
+            return extract_title(detail_soup), extract_clean_article_content(detail_soup)
+
+        pending = []
+        for i, (url, parsed) in enumerate(fetch_details(urls, parse), 1):
+            if parsed is None:
+                continue
+
+            title, content = parsed
+            logger.info(f"📝 [{label}] Processing article {i}/{len(urls)}: {title}")
+
+            if len(content) < MIN_CONTENT_LENGTH:
+                logger.debug(f"⏭️ Content too short for {title} ({len(content)} chars)")
+                continue
+
+            # Check for duplicate content (mirrored posts under other URLs) before embedding
+            if self.known.has_content(content_hash(content)):
+                logger.debug(f"⏭️ Skipping duplicate content: {title}")
+                continue
+
+            pending.append((title, url, content))
+            logger.info(f"✅ [{label}] QUEUED: {title}")
+        return pending
+    
+    def persist(self, pending, label):
+        """
+        Embed a page's articles in one batch and insert them
+        
+        Args:
+            pending (list): (title, url, content) tuples from collect()
+            label (str): Category name used in log messages
+            
+        Returns:
+            int: Number of articles inserted (the unique keys drop duplicates)
+        """
+        rows = build_rows(pending)
+        inserted = insert_articles(self.conn, self.cur, rows)
+        if inserted:
+            self.known.add_rows(rows)
+        if rows:
+            logger.info(f"💾 [{label}] INSERTED {inserted}/{len(rows)} articles from page")
+        return inserted
+    
+    def scrape_page(self, urls, label, extract_title):
+        """
+        Run the full pipeline for the article links of one listing page
+        
+        Args:
+            urls (iterable): Article URLs found on the page
+            label (str): Category name used in log messages
+            extract_title (callable): Returns the title from a parsed article page
+            
+        Returns:
+            int: Number of articles inserted
+        """
+        pending = self.collect(self.new_urls(urls), label, extract_title)
+        return self.persist(pending, label)
+
+
+def scrape_single_category(scraper, category_slug):
     """
     Scrape a single category from phoreveryoung.wordpress.com
     
     Args:
+        scraper (ArticleScraper): Article pipeline for this site
         category_slug (str): The category slug (e.g., 'health/nutrition' or 'research')
     
     Returns:
@@ -310,8 +1046,8 @@ def scrape_single_category(category_slug):
     while page_url:
         # Fetch page content
         try:
-            response = requests.get(page_url, headers=HEADERS, timeout=15)
-            soup = BeautifulSoup(response.text, "html.parser")
+            response = polite_get(page_url)
+            soup = BeautifulSoup(response.content, "lxml", parse_only=LISTING_STRAINER)
         except Exception as e:
             logger.error(f"❌ Failed to fetch {page_url}: {e}")
             break
@@ -324,131 +1060,50 @@ def scrape_single_category(category_slug):
 
         logger.info(f"📄 Found {len(articles)} articles on page: {page_url}")
         
-        for i, art in enumerate(articles, 1):
-            # Extract article URL
+        # Extract article URLs from the title links
+        urls = []
+        for art in articles:
             title_link = art.find("a", href=True)
-            if not title_link:
-                continue
-
-            url = title_link["href"]
-
-            # Check if article already exists in database (by URL)
-            cur.execute("SELECT 1 FROM dr_young_all_articles WHERE url=%s", (url,))
-            result = cur.fetchone()
-            cur.fetchall()  # Consume any remaining results
-            if result:
-                logger.debug(f"⏭️ Skipping existing article by URL: {url}")
-                continue
-
-            # Fetch detailed article content
-            try:
-                detail_res = requests.get(
-                    url,
-                    headers=HEADERS,
-                    timeout=10,
-                    verify=False
-                )
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to fetch article {url}: {e}")
-                continue
-
-            detail_soup = BeautifulSoup(detail_res.text, "html.parser")
-
-            # Extract article title - look for the correct article title
-            # First try entry-title class (WordPress standard)
-            title_elem = detail_soup.find(class_="entry-title")
-            
-            # If not found, try the first h1 that is not the site header
-            if not title_elem:
-                h1_tags = detail_soup.find_all("h1")
-                # Skip the first h1 if it contains site name
-                for h1 in h1_tags:
-                    text = h1.get_text(strip=True)
-                    if text and "pHorever Young" not in text and "Blog" not in text:
-                        title_elem = h1
-                        break
-                # If all h1 tags contain site name, use the first one
-                if not title_elem and h1_tags:
-                    title_elem = h1_tags[0]
-            
-            title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-
-            # Show article title being processed
-            logger.info(f"📝 [{category_slug}] Processing article {i}/{len(articles)}: INSERTED {title}")
-
-            # Extract and clean article content
-            content = extract_clean_article_content(detail_soup)
-            if len(content) < MIN_CONTENT_LENGTH:
-                logger.debug(f"⏭️ Content too short for {title} ({len(content)} chars)")
-                continue
+            if title_link:
+                urls.append(title_link["href"])
 
-            # Generate embedding for semantic search
-            embedding = model.encode(content).tolist()
-
-            # Check for duplicates: if same title AND same content, skip
-            cur.execute("SELECT title, content FROM dr_young_all_articles WHERE title = %s", (title,))
-            result = cur.fetchone()
-            cur.fetchall()  # Consume any remaining results
-            if result:
-                existing_title, existing_content = result
-                # If content is also the same, skip (true duplicate)
-                if existing_content == content:
-                    logger.debug(f"⏭️ Skipping exact duplicate (same title and content): {title}")
-                    continue
-                else:
-                    # Same title but different content - this is a different article, so proceed
-                    logger.debug(f"📝 Same title but different content found: {title}")
-                    # Continue with insertion below
-            
-            # Insert article into database
-            cur.execute("""
-                INSERT INTO dr_young_all_articles
-                (title, url, content, embedding)
-                VALUES (%s, %s, %s, %s)
-            """, (title, url, content, str(embedding)))
-
-            # Get the ID of the inserted row
-            inserted_id = cur.lastrowid
-            conn.commit()
-            total_articles += 1
-            logger.info(f"✅ [{category_slug}] INSERTED (ID: {inserted_id}): {title}")
-
-            # Respectful delay between articles
-            time.sleep(ARTICLE_DELAY)
+        total_articles += scraper.scrape_page(urls, category_slug, wordpress_title)
 
         # Get next page URL for pagination
         next_link = soup.find("a", class_="next")
         page_url = urljoin(base_url, next_link["href"]) if next_link else None
         if page_url:
             logger.info(f"➡️ Moving to next page: {page_url}")
-            time.sleep(PAGE_DELAY)
 
     logger.info(f"🏁 FINISHED CATEGORY {category_slug}: {total_articles} articles")
     return total_articles
 
 
-def scrape_all_categories():
+def scrape_all_categories(scraper, categories):
     """
     Scrape all categories from phoreveryoung.wordpress.com
     
     This function scrapes articles from all identified categories,
     extracts their content, generates embeddings, and stores them in the database.
     
+    Args:
+        scraper (ArticleScraper): Article pipeline for this site
+        categories (list): Category slugs from discover_all_categories()
+    
     Returns:
         tuple: (total_articles, category_stats_dict) - Total articles and per-category stats
     """
-    global ALL_CATEGORIES
     total_articles = 0
     failed_categories = []
     category_stats = {}
     
     logger.info("🚀 STARTING FULL CATEGORY SCRAPER")
-    logger.info(f"📋 Total categories to scrape: {len(ALL_CATEGORIES)}")
+    logger.info(f"📋 Total categories to scrape: {len(categories)}")
     
-    for i, category in enumerate(ALL_CATEGORIES, 1):
-        logger.info(f"\n[{i}/{len(ALL_CATEGORIES)}] Processing category: {category}")
+    for i, category in enumerate(categories, 1):
+        logger.info(f"\n[{i}/{len(categories)}] Processing category: {category}")
         try:
-            articles_count = scrape_single_category(category)
+            articles_count = scrape_single_category(scraper, category)
             total_articles += articles_count
             category_stats[category] = articles_count
             logger.info(f"✅ Completed {category}: {articles_count} articles")
@@ -456,11 +1111,6 @@ def scrape_all_categories():
             logger.error(f"❌ Failed to scrape category {category}: {e}")
             failed_categories.append(category)
             category_stats[category] = 0
-        
-        # Add extra delay between categories
-        if i < len(ALL_CATEGORIES):
-            logger.info(f"⏳ Waiting before next category...")
-            time.sleep(5)
     
     logger.info("\n🏁 FULL CATEGORY SCRAPING COMPLETED")
     logger.info(f"📊 Total articles scraped: {total_articles}")
@@ -469,13 +1119,32 @@ def scrape_all_categories():
     
     return total_articles, category_stats
 
-def scrape_dr_young_blog():
+def scrape_wordpress_site(scraper):
+    """
+    Discover and scrape every category on phoreveryoung.wordpress.com
+    
+    Args:
+        scraper (ArticleScraper): Article pipeline for this site
+    
+    Returns:
+        tuple: (categories, total_articles, category_stats_dict)
+    """
+    logger.info("\n=== PHOREVERYOUNG.WORDPRESS.COM ===")
+    all_categories = discover_all_categories()
+    wp_articles, wp_category_stats = scrape_all_categories(scraper, all_categories)
+    return all_categories, wp_articles, wp_category_stats
+
+
+def scrape_dr_young_blog(scraper):
     """
     Scrape articles from Dr. Robert Young's blog (https://drrobertyoung.com/blog/)
     
     This function scrapes articles from the main blog page and all category pages,
     extracts their content, generates embeddings, and stores them in the database.
     
+    Args:
+        scraper (ArticleScraper): Article pipeline for this site
+    
     Returns:
         tuple: (total_articles, category_stats_dict) - Total articles and per-category stats
     """
@@ -486,11 +1155,11 @@ def scrape_dr_young_blog():
     
     # First, discover all blog categories
     try:
-        response = requests.get(DR_YOUNG_BLOG_URL, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = polite_get(DR_YOUNG_BLOG_URL)
+        soup = BeautifulSoup(response.content, "lxml", parse_only=LINK_STRAINER)
         
         # Find category links
-        category_links = soup.find_all('a', href=re.compile(r'https://drrobertyoung\.com/[^/]+/$'))
+        category_links = soup.find_all('a', href=DRY_CATEGORY_RE)
         categories = set()
         
         for link in category_links:
@@ -515,105 +1184,39 @@ def scrape_dr_young_blog():
     for url in urls_to_scrape:
         logger.info(f"🔍 Scraping: {url}")
         try:
-            response = requests.get(url, headers=HEADERS, timeout=15)
-            soup = BeautifulSoup(response.text, "html.parser")
+            response = polite_get(url)
+            soup = BeautifulSoup(response.content, "lxml")
             
             # Find all post elements (this site uses 'post' class instead of article tags)
-            post_elements = soup.find_all(class_=re.compile(r'post'))
+            post_elements = soup.find_all(class_=POST_CLASS_RE)
             logger.info(f"📄 Found {len(post_elements)} post elements")
             
             # Extract links from post elements
             article_links = []
             for post in post_elements:
                 # Look for links within each post
-                links = post.find_all('a', href=re.compile(r'https://drrobertyoung\.com/'))
+                links = post.find_all('a', href=DRY_LINK_RE)
                 article_links.extend(links)
             
             # Also look for direct post links on the page
-            direct_post_links = soup.find_all('a', href=re.compile(r'https://drrobertyoung\.com/[^/]+/[^/]+/$'))
+            direct_post_links = soup.find_all('a', href=DRY_POST_RE)
             article_links.extend(direct_post_links)
             
-            # Remove duplicates and filter out non-article links
-            article_links = list(set([link for link in article_links 
-                                    if link.get('href') and 
-                                       'drrobertyoung.com' in link.get('href') and
-                                       not any(skip in link.get('href') for skip in 
-                                               ['/category/', '/tag/', '/page/', '#', '?', '.jpg', '.png'])]))
+            # Remove duplicate URLs and filter out non-article links
+            hrefs = {link.get('href') for link in article_links}
+            article_urls = [href for href in hrefs
+                            if href and 'drrobertyoung.com' in href and not NON_ARTICLE_LINK_RE.search(href)]
             
-            logger.info(f"📄 Found {len(article_links)} potential articles")
+            logger.info(f"📄 Found {len(article_urls)} potential articles")
             
             # Debug: Show first few links found
-            if article_links:
-                logger.debug(f"First 3 article links: {[link.get('href') for link in article_links[:3]]}")
+            if article_urls:
+                logger.debug(f"First 3 article links: {article_urls[:3]}")
             
             category_name = url.rstrip('/').split('/')[-1] if url != DR_YOUNG_BLOG_URL else 'main_blog'
-            category_article_count = 0
             
-            for i, link in enumerate(article_links, 1):
-                article_url = link.get('href')
-                if not article_url:
-                    continue
-                
-                # Check if article already exists in database (by URL)
-                cur.execute("SELECT 1 FROM dr_young_all_articles WHERE url=%s", (article_url,))
-                result = cur.fetchone()
-                cur.fetchall()  # Consume any remaining results
-                if result:
-                    logger.debug(f"⏭️ Skipping existing article by URL: {article_url}")
-                    continue
-                
-                # Fetch article content
-                try:
-                    detail_res = requests.get(article_url, headers=HEADERS, timeout=10, verify=False)
-                    detail_soup = BeautifulSoup(detail_res.text, "html.parser")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to fetch {article_url}: {e}")
-                    continue
-                
-                # Extract title
-                title_elem = detail_soup.find("h1") or detail_soup.find(class_="entry-title")
-                title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-                
-                # Extract content
-                content = extract_clean_article_content(detail_soup)
-                if len(content) < MIN_CONTENT_LENGTH:
-                    logger.debug(f"⏭️ Content too short for {title}")
-                    continue
-                
-                # Generate embedding
-                embedding = model.encode(content).tolist()
-                
-                # Check for duplicates: if same title AND same content, skip
-                cur.execute("SELECT title, content FROM dr_young_all_articles WHERE title = %s", (title,))
-                result = cur.fetchone()
-                cur.fetchall()  # Consume any remaining results
-                if result:
-                    existing_title, existing_content = result
-                    # If content is also the same, skip (true duplicate)
-                    if existing_content == content:
-                        logger.debug(f"⏭️ Skipping exact duplicate (same title and content): {title}")
-                        continue
-                    else:
-                        # Same title but different content - this is a different article, so proceed
-                        logger.debug(f"📝 Same title but different content found: {title}")
-                        # Continue with insertion below
-                
-                # Insert into database
-                cur.execute("""
-                    INSERT INTO dr_young_all_articles
-                    (title, url, content, embedding)
-                    VALUES (%s, %s, %s, %s)
-                """, (title, article_url, content, str(embedding)))
-                
-                # Get the ID of the inserted row
-                inserted_id = cur.lastrowid
-                conn.commit()
-                total_articles += 1
-                category_article_count += 1
-                logger.info(f"✅ [{category_name}] INSERTED (ID: {inserted_id}): {title}")
-                
-                # Delay between articles
-                time.sleep(ARTICLE_DELAY)
+            category_article_count = scraper.scrape_page(article_urls, category_name, blog_title)
+            total_articles += category_article_count
                 
             # Update category stats
             category_stats[category_name] = category_article_count
@@ -621,9 +1224,6 @@ def scrape_dr_young_blog():
         except Exception as e:
             logger.error(f"❌ Failed to scrape {url}: {e}")
             continue
-        
-        # Delay between categories/pages
-        time.sleep(PAGE_DELAY)
     
     logger.info(f"🏁 FINISHED DR. ROBERT YOUNG BLOG SCRAPING: {total_articles} articles")
     return total_articles, category_stats
@@ -632,53 +1232,72 @@ def scrape_dr_young_blog():
 # Removed unused function scrape_dr_young_all_categories()
 
 
-# Main execution block
-try:
-    # Use the existing global database connection
-    # conn and cur are already initialized at module level (lines 274-275)
-    pass
+def main():
+    """
+    Run the full multi-site scrape: set up the database, scrape both sites
+    and log a summary of what was stored.
+    """
+    conn, cur = setup_db()
+    blog_conn = None
+    try:
+        known = KnownArticles(cur)
+        # The blog scraper runs on its own thread and needs its own connection
+        blog_conn = get_connection(allow_local_infile=True)
+
+        logger.info("🚀 STARTING MULTI-SITE SCRAPING")
+        
+        # The two sites are different hosts, so scrape them concurrently;
+        # each keeps its own delays and wall time becomes max() instead of sum()
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="site") as executor:
+            wp_scraper = ArticleScraper(conn, cur, known)
+            blog_scraper = ArticleScraper(blog_conn, blog_conn.cursor(buffered=True), known)
+            wp_future = executor.submit(scrape_wordpress_site, wp_scraper)
+            blog_future = executor.submit(scrape_dr_young_blog, blog_scraper)
+            all_categories, wp_articles, wp_category_stats = wp_future.result()
+            blog_articles, blog_category_stats = blog_future.result()
     
-    logger.info("🚀 STARTING MULTI-SITE SCRAPING")
+        # Log final statistics
+        logger.info("\n🎉 MULTI-SITE SCRAPING COMPLETED")
+        logger.info(f"WordPress Categories: {len(all_categories)}")
+        logger.info(f"WordPress Articles: {wp_articles}")
+        logger.info(f"Blog Articles: {blog_articles}")
+        logger.info(f"Total Articles Scraped: {wp_articles + blog_articles}")
     
-    # Scrape from main WordPress site
-    logger.info("\n=== PHOREVERYOUNG.WORDPRESS.COM ===")
-    all_categories = discover_all_categories()
-    ALL_CATEGORIES = all_categories
-    wp_articles, wp_category_stats = scrape_all_categories()
-    
-    # Scrape from Dr. Robert Young's blog
-    logger.info("\n=== DRROBERTYOUNG.COM/BLOG ===")
-    blog_articles, blog_category_stats = scrape_dr_young_blog()
-    
-    # Log final statistics
-    logger.info("\n🎉 MULTI-SITE SCRAPING COMPLETED")
-    logger.info(f"WordPress Categories: {len(all_categories)}")
-    logger.info(f"WordPress Articles: {wp_articles}")
-    logger.info(f"Blog Articles: {blog_articles}")
-    logger.info(f"Total Articles Scraped: {wp_articles + blog_articles}")
-    
-    # Detailed category breakdown
-    logger.info("\n📋 DETAILED CATEGORY BREAKDOWN:")
-    logger.info("\nWordPress Categories:")
-    for category, count in wp_category_stats.items():
-        prefix = "📁" if '/' not in category else "📂"  # Main category vs subcategory
-        logger.info(f"  {prefix} {category}: {count} articles")
-    
-    logger.info("\nDr. Robert Young Blog Categories:")
-    for category, count in blog_category_stats.items():
-        logger.info(f"  📁 {category}: {count} articles")
-    
-    # Summary by category type
-    main_cats = [cat for cat in all_categories if '/' not in cat]
-    sub_cats = [cat for cat in all_categories if '/' in cat]
-    
-    logger.info(f"\n📊 SUMMARY:")
-    logger.info(f"  WordPress main categories: {len(main_cats)} ({sum(wp_category_stats.get(cat, 0) for cat in main_cats)} articles)")
-    logger.info(f"  WordPress subcategories: {len(sub_cats)} ({sum(wp_category_stats.get(cat, 0) for cat in sub_cats)} articles)")
-    logger.info(f"  Blog categories: {len(blog_category_stats)} ({blog_articles} articles)")
-    logger.info(f"  Total categories: {len(all_categories) + len(blog_category_stats)} ({wp_articles + blog_articles} articles)")
-
-finally:
-    # Always close database connection
-    if 'conn' in globals():
+        # Detailed category breakdown
+        logger.info("\n📋 DETAILED CATEGORY BREAKDOWN:")
+        logger.info("\nWordPress Categories:")
+        for category, count in wp_category_stats.items():
+            prefix = "📁" if '/' not in category else "📂"  # Main category vs subcategory
+            logger.info(f"  {prefix} {category}: {count} articles")
+    
+        logger.info("\nDr. Robert Young Blog Categories:")
+        for category, count in blog_category_stats.items():
+            logger.info(f"  📁 {category}: {count} articles")
+    
+        # Summary by category type
+        main_cats = [cat for cat in all_categories if '/' not in cat]
+        sub_cats = [cat for cat in all_categories if '/' in cat]
+    
+        logger.info(f"\n📊 SUMMARY:")
+        logger.info(f"  WordPress main categories: {len(main_cats)} ({sum(wp_category_stats.get(cat, 0) for cat in main_cats)} articles)")
+        logger.info(f"  WordPress subcategories: {len(sub_cats)} ({sum(wp_category_stats.get(cat, 0) for cat in sub_cats)} articles)")
+        logger.info(f"  Blog categories: {len(blog_category_stats)} ({blog_articles} articles)")
+        logger.info(f"  Total categories: {len(all_categories) + len(blog_category_stats)} ({wp_articles + blog_articles} articles)")
+
+        # Refresh the columnar snapshot the API searches, if one is configured
+        if EMBEDDINGS_PARQUET:
+            if PYARROW_AVAILABLE:
+                exported = export_embeddings(EMBEDDINGS_PARQUET, conn)
+                logger.info(f"💾 Exported {exported} embeddings to {EMBEDDINGS_PARQUET}")
+            else:
+                logger.warning("⚠️ EMBEDDINGS_PARQUET is set but pyarrow is not installed; skipping export")
+
+    finally:
+        # Always close database connections (the blog one may never have opened)
         conn.close()
+        if blog_conn is not None:
+            blog_conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Title and content extraction must give the same results on both HTML backends
+
+parse_article() returns a selectolax document when selectolax is installed
+and a strained BeautifulSoup otherwise; the extractors dispatch on the node
+type, so each one is run against both.
+"""
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+
+from bs4 import BeautifulSoup
+
+from scraper import scrape_and_embed as scraper
+
+BODY = "Alkaline water and green vegetables support the body's natural buffering systems."
+
+WORDPRESS_PAGE = f"""
+<html><body>
+  <h1>pHorever Young Blog</h1>
+  <article>
+    <h1 class="entry-title">Why pH Matters</h1>
+    <div class="entry-content">
+      <p>{BODY}</p>
+      <p>Too short</p>
+      <li>Share this: Facebook, Twitter and more sharing options for readers</li>
+      <h2>Green drinks are a simple daily habit worth building up over time</h2>
+    </div>
+  </article>
+</body></html>
+""".encode()
+
+BLOG_PAGE = f"""
+<html><body>
+  <h1>The Alkaline Way</h1>
+  <main><p>{BODY}</p></main>
+</body></html>
+""".encode()
+
+
+def bs4_backend(html):
+    return BeautifulSoup(html, "lxml", parse_only=scraper.ARTICLE_STRAINER)
+
+
+def selectolax_backend(html):
+    if not scraper.SELECTOLAX_AVAILABLE:
+        pytest.skip("selectolax not installed")
+    return scraper.HTMLParser(html)
+
+
+BACKENDS = pytest.mark.parametrize("parse", [bs4_backend, selectolax_backend], ids=["bs4", "selectolax"])
+
+
+@BACKENDS
+def test_wordpress_title(parse):
+    assert scraper.wordpress_title(parse(WORDPRESS_PAGE)) == "Why pH Matters"
+
+
+@BACKENDS
+def test_blog_title(parse):
+    assert scraper.blog_title(parse(BLOG_PAGE)) == "The Alkaline Way"
+
+
+@BACKENDS
+def test_extract_clean_article_content(parse):
+    content = scraper.extract_clean_article_content(parse(WORDPRESS_PAGE))
+    assert content.split("\n") == [
+        BODY,
+        "Green drinks are a simple daily habit worth building up over time",
+    ]
@@ -0,0 +1,26 @@
+"""
+KnownArticles loads stored rows, tolerating rows without a URL
+"""
+
+from scraper import scrape_and_embed as scraper
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, query):
+        pass
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_rows_without_url_are_skipped():
+    known = scraper.KnownArticles(FakeCursor([
+        ("https://drrobertyoung.com/post/example/?utm_source=x", b"\x01" * 20),
+        (None, b"\x02" * 20),
+        ("", None),
+    ]))
+    assert known.urls == {"https://drrobertyoung.com/post/example/"}
+    assert known.has_content(b"\x02" * 20)
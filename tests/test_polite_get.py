@@ -0,0 +1,81 @@
+"""
+polite_get() may only skip the host's rate limiter for fresh HTTP cache hits
+"""
+
+import datetime
+import io
+
+import pytest
+
+requests_cache = pytest.importorskip("requests_cache")
+
+import requests
+from urllib3 import HTTPResponse
+
+from scraper import scrape_and_embed as scraper
+
+URL = "https://drrobertyoung.com/post/example/"
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+    def slow_down(self):
+        pass
+
+    def speed_up(self):
+        pass
+
+
+def make_response(session, url):
+    request = session.prepare_request(requests.Request("GET", url))
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"<html></html>"
+    response.url = url
+    response.request = request
+    response.headers["Content-Type"] = "text/html"
+    response.raw = HTTPResponse(body=io.BytesIO(response._content), status=200,
+                                preload_content=False, request_url=url)
+    return response
+
+
+@pytest.fixture
+def cached_session(monkeypatch):
+    session = requests_cache.CachedSession(backend="memory", expire_after=3600)
+    limiter = CountingLimiter()
+    monkeypatch.setattr(scraper, "SESSION", session)
+    monkeypatch.setattr(scraper, "get_limiter", lambda url: limiter)
+    # Never touch the network: every GET returns the canned page
+    monkeypatch.setattr(session, "get", lambda url, **kwargs: make_response(session, url))
+    return session, limiter
+
+
+def cache(session, url, expires):
+    response = make_response(session, url)
+    session.cache.save_response(response, session.cache.create_key(response.request), expires=expires)
+
+
+def test_fresh_entry_skips_limiter(cached_session):
+    session, limiter = cached_session
+    cache(session, URL, datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1))
+    scraper.polite_get(URL)
+    assert limiter.acquired == 0
+
+
+def test_expired_entry_waits_for_limiter(cached_session):
+    session, limiter = cached_session
+    cache(session, URL, datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1))
+    assert session.cache.contains(url=URL)  # Present, but stale
+    scraper.polite_get(URL)
+    assert limiter.acquired == 1
+
+
+def test_uncached_url_waits_for_limiter(cached_session):
+    _, limiter = cached_session
+    scraper.polite_get(URL)
+    assert limiter.acquired == 1
@@ -0,0 +1,29 @@
+"""
+RateLimiter backoff: one doubling per burst of throttled responses
+"""
+
+from scraper import scrape_and_embed as scraper
+
+
+def test_concurrent_throttles_back_off_once(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: clock[0])
+    limiter = scraper.RateLimiter(rate=2, burst=4)
+
+    # Four in-flight fetches all come back 429 at about the same time
+    for _ in range(4):
+        limiter.slow_down()
+    assert limiter.interval == 1.0
+
+    # A throttle after the new interval has passed is a fresh signal
+    clock[0] += 1.0
+    limiter.slow_down()
+    assert limiter.interval == 2.0
+
+
+def test_speed_up_returns_to_base_rate():
+    limiter = scraper.RateLimiter(rate=2, burst=4)
+    limiter.slow_down()
+    for _ in range(20):
+        limiter.speed_up()
+    assert limiter.interval == limiter.base_interval
@@ -14,8 +14,16 @@ Key Features:
 - Health check endpoint for monitoring
 """
 
+import copy
+import gzip
+import hashlib
+import logging
 import os
+import queue
+import re
 import sys
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add project root to Python path for module imports
@@ -26,53 +34,148 @@ sys.path.insert(0, str(project_root))
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles      # Serve static files
 from fastapi.middleware.cors import CORSMiddleware  # Handle cross-origin requests
-from fastapi.responses import HTMLResponse       # HTML response handling
+from fastapi.middleware.gzip import GZipMiddleware  # Compress larger responses
+from fastapi.responses import HTMLResponse, Response  # HTML response handling
 import uvicorn                                   # ASGI server
 
+try:
+    import brotli                                # Optional: br-encoded landing page
+except ImportError:
+    brotli = None
+
 # Import backend components from existing module
 from backend.main import app as backend_app
 
+@asynccontextmanager
+async def lifespan(app):
+    """Run the backend's startup/shutdown (mounted apps get no lifespan events of their own)"""
+    async with backend_app.router.lifespan_context(backend_app):
+        yield
+
 # Create unified FastAPI app with descriptive metadata
 app = FastAPI(
     title="Dr. Robert O . Young  - Unified Server",
     description="Combined frontend and backend server",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # API docs are served by the mounted backend at /api/docs
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None
 )
 
+# Origins allowed to call the API cross-origin (comma-separated); the bundled
+# frontend is served from this app, so it never needs CORS itself
+FRONTEND_ORIGINS = os.getenv("FRONTEND_ORIGINS", "http://127.0.0.1:8000,http://localhost:8000").split(",")
+
 # Add CORS middleware to handle cross-origin requests
 # This is essential for frontend-backend communication in development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],          # Allow all origins (adjust for production)
+    allow_origins=[origin.strip() for origin in FRONTEND_ORIGINS],
     allow_credentials=True,       # Allow cookies/credentials
-    allow_methods=["*"],          # Allow all HTTP methods
-    allow_headers=["*"]           # Allow all headers
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400                 # Let browsers cache preflights for a day
 )
 
-# Mount backend routes under /api prefix
-# This makes all backend endpoints available at /api/*
-app.mount("/api", backend_app)
+# Compress responses over 1 KB for every route, including the mounted API and
+# static files; responses that already carry a Content-Encoding (the
+# precompressed landing page) are passed through untouched. Streamed /chat
+# answers are flushed chunk by chunk only on Starlette >= 1.5 (pinned in
+# requirements.txt); older releases buffer the whole stream.
+GZIP_MINIMUM_SIZE = 1024
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5)
+
+# Caching policy for HTML documents: browsers/CDNs may reuse a page for a
+# minute (and serve it stale while revalidating for ten); a deploy changes
+# the ETag, so staleness is bounded
+HTML_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that tells browsers how long assets may be reused
+    
+    Fingerprinted files (name.<hash>.ext) never change under the same name,
+    so they are cached for a year as immutable. HTML pages get the same
+    short policy as / so a deploy shows up within a minute. Everything else
+    is cached for an hour and then revalidated via the ETag/Last-Modified
+    headers StaticFiles already sends.
+    """
 
-# Serve static frontend files from frontend directory
+    HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.(?:js|css|png|jpe?g|svg|webp|woff2?)$")
+
+    def file_response(self, full_path, *args, **kwargs):
+        response = super().file_response(full_path, *args, **kwargs)
+        if self.HASHED_ASSET_RE.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        elif str(full_path).endswith((".html", ".htm")):
+            response.headers["Cache-Control"] = HTML_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
+# Frontend directory (index.html plus any assets it references)
 frontend_dir = Path(__file__).parent / "frontend"
-if frontend_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_dir)), name="static")
+
+# Read the landing page once at startup; it only changes on deploy
+frontend_path = frontend_dir / "index.html"
+INDEX_HTML = frontend_path.read_bytes() if frontend_path.exists() else None
+
+# Compress the landing page once per encoding instead of per request.
+# Each encoding gets its own strong validator so repeat visits get a 304.
+INDEX_VARIANTS = {}  # Content-Encoding ("" = identity) -> (body, headers, 304 headers)
+if INDEX_HTML is not None:
+    index_digest = hashlib.blake2b(INDEX_HTML, digest_size=16).hexdigest()
+    index_bodies = {"": INDEX_HTML, "gzip": gzip.compress(INDEX_HTML, 9)}
+    if brotli is not None:
+        index_bodies["br"] = brotli.compress(INDEX_HTML, quality=11)
+    for encoding, body in index_bodies.items():
+        headers = {
+            "ETag": f'"{index_digest}-{encoding}"' if encoding else f'"{index_digest}"',
+            "Cache-Control": HTML_CACHE_CONTROL
+        }
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        # GZipMiddleware appends its own Vary to bodies it inspects (identity
+        # pages over its minimum size), so only set it where the middleware
+        # will not: precompressed bodies, small pages and empty 304s. 304s
+        # carry only the validators and caching policy (no body, so no
+        # Content-Encoding).
+        not_modified_headers = {
+            "ETag": headers["ETag"],
+            "Cache-Control": headers["Cache-Control"],
+            "Vary": "Accept-Encoding"
+        }
+        if encoding or len(body) < GZIP_MINIMUM_SIZE:
+            headers = {**headers, "Vary": "Accept-Encoding"}
+        INDEX_VARIANTS[encoding] = (body, headers, not_modified_headers)
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Serve the main frontend page
     
-    This endpoint reads and serves the index.html file from the frontend directory,
-    providing the complete chat interface to users.
+    This endpoint serves the index.html file from the frontend directory,
+    providing the complete chat interface to users. The page is held in
+    memory (read and precompressed at startup), so requests do no disk I/O
+    or compression work. Browsers that already have the current version
+    (matching If-None-Match) get an empty 304 instead of the full page.
     
     Returns:
         HTMLResponse: Complete frontend HTML page
     """
-    frontend_path = frontend_dir / "index.html"
-    if frontend_path.exists():
-        with open(frontend_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return content
+    if INDEX_VARIANTS:
+        accept_encoding = request.headers.get("accept-encoding", "")
+        if "br" in accept_encoding and "br" in INDEX_VARIANTS:
+            body, headers, not_modified_headers = INDEX_VARIANTS["br"]
+        elif "gzip" in accept_encoding:
+            body, headers, not_modified_headers = INDEX_VARIANTS["gzip"]
+        else:
+            body, headers, not_modified_headers = INDEX_VARIANTS[""]
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if headers["ETag"] in if_none_match or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=not_modified_headers)
+        return HTMLResponse(content=body, headers=headers)
     else:
         # Fallback error response if frontend files are missing
         return HTMLResponse(
@@ -80,17 +183,74 @@ async def root():
             status_code=404
         )
 
-@app.get("/health")
-async def health_check():
+# Health response encoded once; every probe reuses the same bytes
+HEALTH_BODY = b'{"status":"healthy","service":"unified-server"}'
+HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTH_BODY)).encode())
+]
+
+class HealthCheck:
     """Health check endpoint for monitoring and deployment verification
     
     This endpoint provides a simple way to verify that the server is running
     and responding correctly, useful for uptime monitoring and CI/CD pipelines.
+    It is a raw ASGI app rather than a FastAPI route, so frequent probes skip
+    request parsing, dependency resolution and JSON encoding.
     
     Returns:
-        dict: Health status information
+        JSON: Health status information
     """
-    return {"status": "healthy", "service": "unified-server"}
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": HEALTH_HEADERS})
+        await send({"type": "http.response.body", "body": HEALTH_BODY})
+
+app.add_route("/health", HealthCheck(), methods=["GET"], include_in_schema=False)
+
+# Mount backend routes under /api prefix
+# This makes all backend endpoints available at /api/*. Registered after /
+# and /health so the two most frequent paths match on the first probes.
+app.mount("/api", backend_app)
+
+# Serve the remaining frontend files from the site root. Mounted last because
+# Starlette matches in order: /, /health and /api win, everything else falls
+# through to StaticFiles (ETag/Last-Modified, range requests, index.html for
+# directories via html=True)
+if frontend_dir.exists():
+    app.mount("/", CachedStaticFiles(directory=str(frontend_dir), html=True), name="frontend")
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread
+    
+    The stock prepare() formats the record on the calling (event loop)
+    thread; uvicorn's access formatter also needs the raw args, so the
+    record is queued untouched.
+    """
+
+    def prepare(self, record):
+        return record
+
+def queued_access_handler():
+    """Access-log handler whose formatting and stdout writes happen off the event loop"""
+    from uvicorn.logging import AccessFormatter
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(AccessFormatter(
+        '%(levelprefix)s %(client_addr)s - "%(request_line)s" %(status_code)s'
+    ))
+    log_queue = queue.SimpleQueue()
+    QueueListener(log_queue, stream_handler).start()  # Daemon thread, lives with the worker
+    return DeferredQueueHandler(log_queue)
+
+# Production access logging (opt-in): with ACCESS_LOG=1 uvicorn's default
+# config gets the queued access handler; otherwise the default is used as is,
+# so no handler or listener thread is created
+ACCESS_LOG = os.getenv("ACCESS_LOG") == "1"
+LOG_CONFIG = uvicorn.config.LOGGING_CONFIG
+if ACCESS_LOG:
+    LOG_CONFIG = copy.deepcopy(LOG_CONFIG)
+    LOG_CONFIG["handlers"]["access"] = {"()": "unified_server.queued_access_handler"}
 
 if __name__ == "__main__":
     # Startup banner with connection information
@@ -103,10 +263,36 @@ if __name__ == "__main__":
     print("API Docs: http://127.0.0.1:8000/api/docs")
     print("=" * 60)
     
-    # Start the server with auto-reload for development
-    uvicorn.run(
-        "unified_server:app",
-        host="0.0.0.0",      # Listen on all interfaces
-        port=8000,           # Standard development port
-        reload=True          # Auto-reload on code changes
-    )
\ No newline at end of file
+    if os.getenv("ENV") == "dev":
+        # Development: auto-reload on code changes
+        uvicorn.run(
+            "unified_server:app",
+            host="0.0.0.0",      # Listen on all interfaces
+            port=8000,           # Standard development port
+            reload=True          # Auto-reload on code changes
+        )
+    else:
+        # Inherit an already-bound socket from a supervisor when given one
+        # (no rebind, no reload watcher process), listen on a UNIX socket
+        # when fronted by a same-host proxy, otherwise bind the port
+        if "UVICORN_FD" in os.environ:
+            bind = {"fd": int(os.environ["UVICORN_FD"])}
+        elif os.getenv("UVICORN_UDS"):
+            bind = {"uds": os.environ["UVICORN_UDS"]}
+        else:
+            bind = {"host": "0.0.0.0", "port": 8000}
+
+        # Production: no file watcher, uvloop + httptools (uvicorn[standard])
+        # when installed, no per-request access log line unless ACCESS_LOG=1
+        uvicorn.run(
+            "unified_server:app",
+            **bind,
+            loop="auto",         # uvloop if available, else asyncio
+            http="auto",         # httptools if available, else h11
+            access_log=ACCESS_LOG,
+            log_config=LOG_CONFIG,
+            log_level="info" if ACCESS_LOG else "warning",
+            # Each worker loads its own embedding model, so scale up explicitly
+            # (gunicorn --preload shares one copy, see DEPLOYMENT.md)
+            workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+        )
\ No newline at end of file